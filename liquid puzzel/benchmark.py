@@ -0,0 +1,178 @@
+import argparse
+import csv
+import itertools
+import multiprocessing
+import queue
+import signal
+import sys
+import time
+import tracemalloc
+
+from better_model import convert_init_list, init_tubes, a_star_solve
+from board_generator import generate_board
+from learned_heuristic import heuristic_option
+
+# keyword arguments passed to a_star_solve for every solver mode
+SOLVER_MODES = {
+    "a_star": {},
+    "partial_expansion": {"partial_expansion": True},
+    "learned": {"heuristic": "learned"},
+    "partial_pour": {"partial": True},
+    "partial_pour_expansion": {"partial": True, "partial_expansion": True},
+}
+
+FIELDS = ["mode", "colors", "capacity", "tubes_per_color", "tubes", "empty", "shuffle_depth", "seed",
+          "status", "moves", "expansions", "seconds", "peak_kb"]
+
+# tracemalloc slows the solver down about 4 times, the memory run gets this much longer than the timed one
+TRACE_SLOWDOWN = 5
+
+# exit code of a run that raised MemoryError, the OOM killer ends a run with SIGKILL instead
+MEMORY_ERROR_EXIT = 3
+
+
+def run_case(init, capacity, options, results, trace=False):
+    try:
+        solve_case(init, capacity, options, results, trace)
+    except MemoryError:
+        sys.exit(MEMORY_ERROR_EXIT)
+
+
+def solve_case(init, capacity, options, results, trace):
+    # solves once without tracing for the time, or once with tracemalloc for the peak memory
+    tubes = init_tubes(convert_init_list(init), capacity)
+    options = dict(options, heuristic=heuristic_option(options.get("heuristic")))
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    solution = a_star_solve(tubes, verbose=False, **options)
+    seconds = time.perf_counter() - start
+    if trace:
+        results.put(tracemalloc.get_traced_memory()[1] // 1024)
+        tracemalloc.stop()
+        return
+
+    if solution:
+        moves, expansions = solution
+        results.put(("solved", len(moves), expansions, seconds))
+    else:
+        results.put(("unsolved", "", "", seconds))
+
+
+def run_process(init, capacity, options, time_limit, trace):
+    # every run has its own process so a runaway search can be stopped and memory is not shared.
+    # Returns what run_case put, or "timeout", "oom" or "error" for a run that did not finish
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_case, args=(init, capacity, options, results, trace))
+    process.start()
+    process.join(time_limit)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return "timeout"
+    if process.exitcode in (MEMORY_ERROR_EXIT, -signal.SIGKILL):
+        return "oom"
+    if process.exitcode != 0:
+        return "error"
+    try:
+        return results.get(timeout=5)
+    except queue.Empty:
+        return "error"
+
+
+def measure(init, capacity, options, time_limit):
+    # the time comes from a run without tracing, the peak memory from a second, traced run of the same solve
+    result = run_process(init, capacity, options, time_limit, trace=False)
+    if result == "timeout":
+        return "timeout", "", "", time_limit, ""
+    if isinstance(result, str):
+        return result, "", "", "", ""
+    peak_kb = run_process(init, capacity, options, time_limit * TRACE_SLOWDOWN, trace=True)
+    return result + ("" if isinstance(peak_kb, str) else peak_kb,)
+
+
+def sweep(colors, capacities, empty_tubes, shuffle_depths, seeds, modes, time_limit, tubes_per_color=(1,)):
+    # yields one row per solve, a mode is not run on larger boards once a smaller one times out or runs
+    # out of memory. Every color fills tubes_per_color tubes, so the number of tubes grows apart from the
+    # number of colors
+    for mode, capacity, per_color, empty, depth in itertools.product(modes, capacities, tubes_per_color,
+                                                                     empty_tubes, shuffle_depths):
+        for num_colors in colors:
+            num_tubes = num_colors * per_color + empty
+            gave_out = False
+            for seed in seeds:
+                init = generate_board(num_tubes, capacity, num_colors, empty, shuffle_depth=depth, seed=seed)
+                status, moves, expansions, seconds, peak_kb = measure(init, capacity, SOLVER_MODES[mode],
+                                                                      time_limit)
+                gave_out = gave_out or status in ("timeout", "oom")
+                yield dict(zip(FIELDS, [mode, num_colors, capacity, per_color, num_tubes, empty, depth, seed,
+                                        status, moves, expansions, seconds if seconds == "" else round(seconds, 4),
+                                        peak_kb]))
+            if gave_out:
+                break
+
+
+def chart(rows, field, width=40):
+    # text chart of the mean of field against board size, one block per mode, capacity, tubes per color
+    # and empty tubes
+    groups = {}
+    for row in rows:
+        if row["status"] != "solved" or row[field] == "":
+            continue
+        key = (row["mode"], row["capacity"], row["tubes_per_color"], row["empty"], row["shuffle_depth"])
+        groups.setdefault(key, {}).setdefault(row["tubes"], []).append(float(row[field]))
+
+    lines = []
+    for (mode, capacity, per_color, empty, depth), sizes in groups.items():
+        means = {size: sum(values) / len(values) for size, values in sizes.items()}
+        top = max(means.values()) or 1
+        lines.append(f"{field} - {mode}, capacity {capacity}, {per_color} tubes per color, {empty} empty, "
+                     f"shuffle depth {depth}")
+        for size in sorted(means):
+            bar = "#" * max(1, int(width * means[size] / top))
+            lines.append(f"  {size:4d} tubes | {bar} {means[size]:.4g}")
+    return "\n".join(lines)
+
+
+def parse_ints(text):
+    return [int(value) for value in text.split(",")]
+
+
+def parse_depths(text):
+    return [None if value == "random" else int(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the solver modes on generated boards")
+    parser.add_argument("--colors", type=parse_ints, default=[3, 4, 5, 6, 8, 10, 12])
+    parser.add_argument("--capacity", type=parse_ints, default=[4])
+    parser.add_argument("--tubes-per-color", type=parse_ints, default=[1],
+                        help="comma separated numbers of tubes every color fills")
+    parser.add_argument("--empty", type=parse_ints, default=[2], help="comma separated numbers of empty tubes")
+    parser.add_argument("--shuffle-depth", type=parse_depths, default=[None],
+                        help="comma separated depths, 'random' deals the colors at random")
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--modes", type=lambda text: text.split(","), default=list(SOLVER_MODES))
+    parser.add_argument("--time-limit", type=float, default=30.0)
+    parser.add_argument("--csv", help="write every solve to this file")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for row in sweep(args.colors, args.capacity, args.empty, args.shuffle_depth, range(args.seeds), args.modes,
+                     args.time_limit, args.tubes_per_color):
+        print(", ".join(f"{key}={value}" for key, value in row.items()), flush=True)
+        rows.append(row)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as output:
+            writer = csv.DictWriter(output, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    for field in ("seconds", "expansions", "moves", "peak_kb"):
+        print()
+        print(chart(rows, field))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,172 @@
+import argparse
+import ast
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+from better_model import Tube, group_colors
+
+# board file: header, uint16 tube sizes, then num_tubes * capacity colors (bottom of each tube first,
+# unused slots are 0) stored as uint8 when every color fits, uint16 otherwise. Little endian.
+BOARD_MAGIC = b"LQPB"
+BOARD_HEADER = struct.Struct("<4sBBHHH")  # magic, version, color item size, num tubes, capacity, reserved
+# solution file: header, then one (source, destination) uint16 pair per move
+SOLUTION_MAGIC = b"LQPS"
+SOLUTION_HEADER = struct.Struct("<4sBBHI")  # magic, version, reserved, reserved, num moves
+VERSION = 1
+
+
+def little_endian(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def encode_board(init, capacity):
+    # init lists the colors of each tube top first, as given to convert_init_list
+    if not 0 < capacity <= 0xFFFF:
+        raise ValueError(f"capacity must be between 1 and 65535, got {capacity}")
+    colors = [color for tube in init for color in tube]
+    if any(not 0 <= color <= 0xFFFF for color in colors):
+        raise ValueError("colors must be between 0 and 65535")
+    if any(len(tube) > capacity for tube in init):
+        raise ValueError(f"a tube holds more than the capacity {capacity}")
+
+    typecode = "B" if all(color <= 0xFF for color in colors) else "H"
+    sizes = array("H", [len(tube) for tube in init])
+    slots = array(typecode, bytes(len(init) * capacity * array(typecode).itemsize))
+    for index, tube in enumerate(init):
+        slots[index * capacity:index * capacity + len(tube)] = array(typecode, reversed(tube))
+
+    header = BOARD_HEADER.pack(BOARD_MAGIC, VERSION, slots.itemsize, len(init), capacity, 0)
+    return header + little_endian(sizes).tobytes() + little_endian(slots).tobytes()
+
+
+class Board:
+    # view over an encoded board, nothing is parsed until a tube is asked for
+    def __init__(self, data):
+        magic, version, itemsize, num_tubes, capacity, _ = BOARD_HEADER.unpack_from(data)
+        if magic != BOARD_MAGIC or version != VERSION or itemsize not in (1, 2):
+            raise ValueError("not a board file")
+        self.num_tubes = num_tubes
+        self.capacity = capacity
+        view = memoryview(data)
+        sizes_end = BOARD_HEADER.size + 2 * num_tubes
+        colors_end = sizes_end + itemsize * num_tubes * capacity
+        if len(view) < colors_end:
+            raise ValueError("truncated board file")
+        if sys.byteorder == "little":
+            self.sizes = view[BOARD_HEADER.size:sizes_end].cast("H")
+            self.colors = view[sizes_end:colors_end].cast("B" if itemsize == 1 else "H")
+        else:
+            self.sizes = little_endian(array("H", view[BOARD_HEADER.size:sizes_end]))
+            self.colors = little_endian(array("B" if itemsize == 1 else "H", view[sizes_end:colors_end]))
+
+    def tube(self, index):
+        # colors of a tube, bottom first
+        start = index * self.capacity
+        return self.colors[start:start + self.sizes[index]].tolist()
+
+    def to_init(self):
+        return [list(reversed(self.tube(index))) for index in range(self.num_tubes)]
+
+    def to_tubes(self):
+        return [Tube(group_colors(self.tube(index)), self.capacity) for index in range(self.num_tubes)]
+
+
+def save_board(path, init, capacity):
+    with open(path, "wb") as file:
+        file.write(encode_board(init, capacity))
+
+
+def load_board(path):
+    # memory maps the file, the returned Board reads straight from the mapping
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Board(data)
+
+
+def encode_solution(moves):
+    pairs = array("H", [index for pair in moves for index in pair])
+    return SOLUTION_HEADER.pack(SOLUTION_MAGIC, VERSION, 0, 0, len(moves)) + little_endian(pairs).tobytes()
+
+
+def decode_solution(data):
+    magic, version, _, _, count = SOLUTION_HEADER.unpack_from(data)
+    if magic != SOLUTION_MAGIC or version != VERSION:
+        raise ValueError("not a solution file")
+    pairs = little_endian(array("H", bytes(data[SOLUTION_HEADER.size:SOLUTION_HEADER.size + 4 * count])))
+    return [(pairs[2 * index], pairs[2 * index + 1]) for index in range(count)]
+
+
+def save_solution(path, moves):
+    with open(path, "wb") as file:
+        file.write(encode_solution(moves))
+
+
+def load_solution(path):
+    with open(path, "rb") as file:
+        return decode_solution(file.read())
+
+
+def parse_rtf(text):
+    # boards of "liquid puzzle test examples.rtf": blocks that start with a ###N### line and hold
+    # "size = N" and "init = [...]" (the RTF ends every line with a backslash)
+    text = text.replace("\\\n", "\n")
+    boards = []
+    for match in re.finditer(r"#+\s*(\d+)\s*#+(.*?)(?=#+\s*\d+\s*#+|\Z)", text, re.S):
+        block = match.group(2)
+        capacity = re.search(r"\bsize\s*=\s*(\d+)", block) or re.search(r"\bfull\s*=\s*(\d+)", block)
+        init = re.search(r"\binit\s*=\s*(\[.*\]\])", block, re.S)
+        if capacity and init:
+            boards.append((int(match.group(1)), ast.literal_eval(init.group(1)), int(capacity.group(1))))
+    return boards
+
+
+def convert_rtf(rtf_path, output_dir):
+    with open(rtf_path, encoding="utf-8", errors="replace") as file:
+        boards = parse_rtf(file.read())
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for number, init, capacity in boards:
+        path = os.path.join(output_dir, f"example_{number}.lqb")
+        save_board(path, init, capacity)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert boards to and from the binary board format")
+    commands = parser.add_subparsers(dest="command", required=True)
+    from_rtf = commands.add_parser("from-rtf", help="convert every board of the RTF examples file")
+    from_rtf.add_argument("rtf")
+    from_rtf.add_argument("output_dir")
+    from_init = commands.add_parser("from-init", help="convert an init list given as a Python literal")
+    from_init.add_argument("init", help="init list, or @file holding it")
+    from_init.add_argument("capacity", type=int)
+    from_init.add_argument("output")
+    show = commands.add_parser("show", help="print a board file as an init list")
+    show.add_argument("board")
+    args = parser.parse_args(argv)
+
+    if args.command == "from-rtf":
+        for path in convert_rtf(args.rtf, args.output_dir):
+            print(path)
+    elif args.command == "from-init":
+        text = args.init
+        if text.startswith("@"):
+            with open(text[1:]) as file:
+                text = file.read()
+        save_board(args.output, ast.literal_eval(text), args.capacity)
+    else:
+        board = load_board(args.board)
+        print(f"capacity = {board.capacity}")
+        print(f"init = {board.to_init()}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
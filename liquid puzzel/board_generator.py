@@ -0,0 +1,73 @@
+import random
+
+
+def solved_board(num_tubes, capacity, num_colors, empty_tubes):
+    # tubes are listed bottom first, every color fills the same number of tubes
+    filled_tubes = num_tubes - empty_tubes
+    if capacity <= 0 or num_colors <= 0 or empty_tubes < 0 or filled_tubes <= 0:
+        raise ValueError("capacity and colors must be positive and there must be at least one filled tube")
+    if filled_tubes % num_colors:
+        raise ValueError(f"{filled_tubes} filled tubes can not be split between {num_colors} colors")
+
+    tubes_per_color = filled_tubes // num_colors
+    board = [[color] * capacity for color in range(num_colors) for _ in range(tubes_per_color)]
+    board += [[] for _ in range(empty_tubes)]
+    return board
+
+
+def unpour(board, capacity, rng, last_move=None):
+    # applies a random reverse move: the forward move from the new tube back is always legal,
+    # so a board scrambled with these moves stays solvable
+    candidates = []
+    for source, tube in enumerate(board):
+        if not tube:
+            continue
+        color = tube[-1]
+        run = 1
+        while run < len(tube) and tube[-run - 1] == color:
+            run += 1
+        for destination, target in enumerate(board):
+            if destination == source or (destination, source) == last_move:
+                continue
+            if target and target[-1] == color:
+                continue
+            space = capacity - len(target)
+            for count in range(1, min(run, space) + 1):
+                # the colors left on top of the source have to match the ones poured back
+                if count == run and run < len(tube):
+                    continue
+                # pouring a whole tube into an empty one only renames the tubes
+                if count == len(tube) and not target:
+                    continue
+                candidates.append((source, destination, count))
+
+    if not candidates:
+        return None
+    source, destination, count = rng.choice(candidates)
+    moved = board[source][-count:]
+    del board[source][-count:]
+    board[destination].extend(moved)
+    return source, destination
+
+
+def generate_board(num_tubes, capacity, num_colors, empty_tubes, shuffle_depth=None, seed=None):
+    # returns an init list (top of each tube first) ready for convert_init_list.
+    # shuffle_depth=None deals the colors at random, which may give an unsolvable board;
+    # otherwise the solved board is scrambled with shuffle_depth reverse moves and stays solvable
+    rng = random.Random(seed)
+    board = solved_board(num_tubes, capacity, num_colors, empty_tubes)
+
+    if shuffle_depth is None:
+        units = [color for tube in board for color in tube]
+        rng.shuffle(units)
+        filled_tubes = num_tubes - empty_tubes
+        board = [units[i * capacity:(i + 1) * capacity] for i in range(filled_tubes)]
+        board += [[] for _ in range(empty_tubes)]
+    else:
+        last_move = None
+        for _ in range(shuffle_depth):
+            last_move = unpour(board, capacity, rng, last_move)
+            if last_move is None:
+                break
+
+    return [list(reversed(tube)) for tube in board]
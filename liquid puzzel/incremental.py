@@ -0,0 +1,101 @@
+from better_model import Tube, move, is_solved, is_tube_done, solve
+
+
+def match_tubes(previous, tubes):
+    # mapping[k] is the index in tubes of the k-th previous tube, or None when it is gone.
+    # Identical tubes are matched first, the edited ones then go to the remaining tube that
+    # shares the longest bottom with them
+    mapping = [None] * len(previous)
+    free = {}
+    for index, tube in enumerate(tubes):
+        free.setdefault((tube.capacity, tuple(tube.colors)), []).append(index)
+    for k, tube in enumerate(previous):
+        same = free.get((tube.capacity, tuple(tube.colors)))
+        if same:
+            mapping[k] = same.pop(0)
+
+    remaining = set(index for indexes in free.values() for index in indexes)
+    for k, tube in enumerate(previous):
+        if mapping[k] is not None:
+            continue
+        candidates = [index for index in sorted(remaining) if tubes[index].capacity == tube.capacity]
+        if candidates:
+            mapping[k] = max(candidates, key=lambda index: (shared_bottom(tube, tubes[index]), -index))
+            remaining.discard(mapping[k])
+    return mapping
+
+
+def shared_bottom(first, second):
+    # number of units both tubes hold in the same places, counted from the bottom
+    units = 0
+    for (color, count), (other_color, other_count) in zip(first.colors, second.colors):
+        if color != other_color:
+            break
+        units += min(count, other_count)
+        if count != other_count:
+            break
+    return units
+
+
+def replay(tubes, moves, mapping, partial=False):
+    # applies the previous moves to tubes for as long as they are legal, returns the state after
+    # every applied move as (board, moves) pairs. Untouched tubes are shared between the states
+    state = tubes
+    path = []
+    states = []
+    for source, destination in moves:
+        source, destination = mapping[source], mapping[destination]
+        if source is None or destination is None or is_tube_done(state[source]):
+            break
+        new_state = state[:]
+        new_state[source] = Tube(state[source].colors[:], state[source].capacity)
+        new_state[destination] = Tube(state[destination].colors[:], state[destination].capacity)
+        if move(new_state, source, destination, partial=partial) != 0:
+            break
+        state = new_state
+        path.append((source, destination))
+        states.append((state, path[:]))
+    return states
+
+
+def previous_shortcuts(previous, moves, tubes, mapping, partial=False):
+    # the states of the previous solution written over tubes, each with the rest of that solution.
+    # Tubes that are new keep their contents, which the previous moves never touch
+    if any(index is None for source, destination in moves for index in (mapping[source], mapping[destination])):
+        return []
+    state = [Tube(tube.colors[:], tube.capacity) for tube in previous]
+    boards = []
+    for step in range(len(moves) + 1):
+        board = [Tube(tube.colors[:], tube.capacity) for tube in tubes]
+        for k, index in enumerate(mapping):
+            if index is not None:
+                board[index] = Tube(state[k].colors[:], state[k].capacity)
+        boards.append((board, [(mapping[source], mapping[destination]) for source, destination in moves[step:]]))
+        if step < len(moves):
+            move(state, moves[step][0], moves[step][1], partial=partial)
+    # the rest of the solution only finishes the new board when its tubes left untouched are finished too
+    if not is_solved(boards[-1][0]):
+        return []
+    return boards
+
+
+def resolve(tubes, previous, previous_moves, partial=False, **options):
+    # solves tubes, a small edit of the board previous that previous_moves solved: the search also
+    # starts from every state the previous moves still reach on the new board, and takes the rest of
+    # the previous solution once it meets one of its states. Passing the dead_states table of the
+    # previous solve reuses what it learned as well
+    mapping = match_tubes(previous, tubes)
+    seeds = replay(tubes, previous_moves, mapping, partial)
+    shortcuts = previous_shortcuts(previous, previous_moves, tubes, mapping, partial)
+    dead_states = options.get("dead_states")
+    known_dead = len(dead_states) if dead_states is not None else 0
+
+    result = solve(tubes, partial=partial, seeds=seeds, shortcuts=shortcuts, **options)
+    result.stats["reuse"] = {
+        "matched_tubes": sum(index is not None for index in mapping),
+        "previous_moves": len(previous_moves),
+        "replayed_moves": len(seeds),
+        "shortcut_moves": result.stats.get("shortcut_moves", 0),
+        "known_dead_states": known_dead,
+    }
+    return result
@@ -0,0 +1,104 @@
+import json
+import os
+
+DEFAULT_WEIGHTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "heuristic_weights.json")
+
+# predicted moves are scaled so the integer costs keep a tenth of a move of resolution
+HEURISTIC_SCALE = 10
+
+FEATURES = ["bias", "extra_groups", "extra_colors", "partial_tubes", "bottom_color_moves", "empty_deficit",
+            "unfinished_tubes"]
+
+
+def state_features(tubes, empty_tubes):
+    # the same quantities heuristic_cost and heuristic_cost0 look at, as one row per state. Every feature
+    # counts tubes, groups or colors, so boards of every capacity share one set of weights. The free space
+    # is counted as the partially filled tubes: summed in units it grows with the capacity, and summed in
+    # tubes it equals the empty-tube deficit on every board that starts with full tubes
+    extra_groups = 0
+    extra_colors = 0
+    partial_tubes = 0
+    unfinished = 0
+    empty_count = 0
+    bottom_colors = set()
+    filled = 0
+
+    for tube in tubes:
+        colors = tube.colors
+        if not colors:
+            empty_count += 1
+            continue
+        filled += 1
+        groups = 1
+        for i in range(1, len(colors)):
+            if colors[i][0] != colors[i - 1][0]:
+                groups += 1
+        distinct = len(set(color for color, _ in colors))
+        extra_groups += groups - 1
+        extra_colors += distinct - 1
+        if tube.size != tube.capacity:
+            partial_tubes += 1
+        if distinct > 1 or tube.size != tube.capacity:
+            unfinished += 1
+        bottom_colors.add(colors[0][0])
+
+    # sum of the number of tubes minus one for each bottom color, as in heuristic_cost0
+    bottom_color_moves = filled - len(bottom_colors)
+    return [1, extra_groups, extra_colors, partial_tubes, bottom_color_moves, max(0, empty_tubes - empty_count),
+            unfinished]
+
+
+class LearnedHeuristic:
+    # linear model of the remaining number of moves, usable wherever heuristic_cost is
+    def __init__(self, weights, scale=HEURISTIC_SCALE):
+        if len(weights) != len(FEATURES):
+            raise ValueError(f"expected {len(FEATURES)} weights, got {len(weights)}")
+        self.weights = [float(weight) for weight in weights]
+        self.scale = scale
+
+    @classmethod
+    def load(cls, path=DEFAULT_WEIGHTS):
+        with open(path) as file:
+            model = json.load(file)
+        if model.get("features") != FEATURES:
+            raise ValueError(f"{path} was trained on features {model.get('features')}, expected {FEATURES}")
+        return cls(model["weights"])
+
+    def save(self, path=DEFAULT_WEIGHTS, **metadata):
+        with open(path, "w") as file:
+            json.dump(dict(metadata, features=FEATURES, weights=self.weights), file, indent=2)
+
+    def predict(self, rows):
+        # one dot product per row, the moves a solution still needs
+        weights = self.weights
+        return [sum(map(float.__mul__, weights, map(float, row))) for row in rows]
+
+    def batch(self, states, empty_tubes):
+        scale = self.scale
+        return [max(0, int(round(moves * scale)))
+                for moves in self.predict([state_features(state, empty_tubes) for state in states])]
+
+    def __call__(self, tubes, empty_tubes):
+        return self.batch([tubes], empty_tubes)[0]
+
+
+def load_heuristic(path=DEFAULT_WEIGHTS):
+    return LearnedHeuristic.load(path)
+
+
+# names the benchmark and the service accept for the heuristic option
+HEURISTIC_NAMES = (None, "default", "learned")
+
+_learned = None  # the shipped weights, loaded once per process by heuristic_option
+
+
+def heuristic_option(name):
+    # maps the heuristic names the benchmark and the service accept to a solve option
+    global _learned
+    if name in (None, "default"):
+        return None
+    if name == "learned":
+        if _learned is None:
+            _learned = load_heuristic()
+        return _learned
+    raise ValueError(f"unknown heuristic {name!r}")
@@ -0,0 +1,126 @@
+import argparse
+import sys
+import time
+import tracemalloc
+
+from better_model import solve, start_tracing, stop_tracing
+from board_format import load_board
+
+# where every phase sits in the collapsed stacks, phases nested in another one are subtracted from it
+PHASE_STACKS = {
+    "solve": "solve",
+    "expand": "solve;expand",
+    "copy": "solve;expand;copy",
+    "move": "solve;expand;move",
+    "dead_states": "solve;expand;dead_states",
+    "heuristic": "solve;expand;heuristic",
+    "order_moves": "solve;expand;order_moves",
+    "is_solved": "solve;is_solved",
+    "hash": "solve;hash",
+    "queue": "solve;queue",
+}
+PARENTS = {phase: parent for phase, stack in PHASE_STACKS.items()
+           for parent, parent_stack in PHASE_STACKS.items() if stack.rsplit(";", 1)[0] == parent_stack != stack}
+
+
+class SearchProfiler:
+    # low overhead phase counters for solve(profiler=...). With trace_allocations every
+    # sample_every-th call of a phase also records the change of tracemalloc's traced memory.
+    # Tracing slows every allocation of the process down so the times are only comparable between runs alike
+    def __init__(self, trace_allocations=False, sample_every=64):
+        self.trace_allocations = trace_allocations
+        self.sample_every = sample_every
+        self.times = dict.fromkeys(PHASE_STACKS, 0)
+        self.calls = dict.fromkeys(PHASE_STACKS, 0)
+        self.allocated = dict.fromkeys(PHASE_STACKS, 0)
+        self.sampled = dict.fromkeys(PHASE_STACKS, 0)
+
+    def start(self):
+        if self.trace_allocations:
+            start_tracing()
+        return self.begin("solve")
+
+    def stop(self, token):
+        self.end("solve", token)
+        if self.trace_allocations:
+            stop_tracing()
+
+    def begin(self, phase):
+        if self.trace_allocations and self.calls[phase] % self.sample_every == 0:
+            return time.perf_counter_ns(), tracemalloc.get_traced_memory()[0]
+        return time.perf_counter_ns(), None
+
+    def end(self, phase, token):
+        started, memory = token
+        self.times[phase] += time.perf_counter_ns() - started
+        self.calls[phase] += 1
+        if memory is not None:
+            self.allocated[phase] += tracemalloc.get_traced_memory()[0] - memory
+            self.sampled[phase] += 1
+
+    def exclusive(self, values):
+        # values of every phase minus the values of the phases nested directly in it
+        own = dict(values)
+        for phase in PHASE_STACKS:
+            if phase in PARENTS:
+                own[PARENTS[phase]] -= values[phase]
+        return own
+
+    def self_times(self):
+        return self.exclusive(self.times)
+
+    def estimated_allocations(self):
+        # net bytes still allocated at the end of each phase, scaled from the sampled calls
+        return {phase: self.allocated[phase] * self.calls[phase] // self.sampled[phase] if self.sampled[phase] else 0
+                for phase in PHASE_STACKS}
+
+    def collapsed(self):
+        # flamegraph.pl / speedscope collapsed stacks, weighted by self time in microseconds
+        own = self.self_times()
+        return "".join(f"{PHASE_STACKS[phase]} {max(0, own[phase]) // 1000}\n"
+                       for phase in PHASE_STACKS if self.calls[phase])
+
+    def write_collapsed(self, path):
+        with open(path, "w") as file:
+            file.write(self.collapsed())
+
+    def summary(self):
+        own = self.self_times()
+        allocated = self.estimated_allocations()
+        total = self.times["solve"] or 1
+        lines = [f"{'phase':12s} {'calls':>9s} {'total ms':>10s} {'self ms':>10s} {'self %':>7s}"
+                 + (f" {'net KB incl.':>13s}" if self.trace_allocations else "")]
+        for phase in PHASE_STACKS:
+            if not self.calls[phase]:
+                continue
+            line = (f"{phase:12s} {self.calls[phase]:9d} {self.times[phase] / 1e6:10.2f} {own[phase] / 1e6:10.2f} "
+                    f"{100 * own[phase] / total:6.1f}%")
+            if self.trace_allocations:
+                line += f" {allocated[phase] / 1024:13.1f}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile a solve phase by phase")
+    parser.add_argument("board", help="board file in the binary board format")
+    parser.add_argument("--collapsed", help="write flamegraph collapsed stacks to this file")
+    parser.add_argument("--allocations", action="store_true", help="sample allocations with tracemalloc")
+    parser.add_argument("--sample-every", type=int, default=64)
+    parser.add_argument("--partial-expansion", action="store_true")
+    parser.add_argument("--partial", action="store_true", help="pour as much of the top run as fits")
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument("--max-expansions", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    profiler = SearchProfiler(args.allocations, args.sample_every)
+    result = solve(load_board(args.board).to_tubes(), timeout=args.timeout, max_expansions=args.max_expansions,
+                   partial_expansion=args.partial_expansion, partial=args.partial, profiler=profiler)
+    print(f"status: {result.status}, expansions: {result.stats['expansions']}")
+    print(profiler.summary())
+    if args.collapsed:
+        profiler.write_collapsed(args.collapsed)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,264 @@
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from better_model import convert_init_list, init_tubes, solve
+from learned_heuristic import heuristic_option, HEURISTIC_NAMES
+
+# solve options a request may set with the JSON types they take (None keeps the solver's default),
+# everything else is ignored
+SOLVE_OPTIONS = {"timeout": (int, float), "max_expansions": (int,), "max_memory": (int,),
+                 "partial_expansion": (bool,), "heuristic": (str,), "partial": (bool,)}
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+def canonical_board(init, capacity):
+    # the same board with its tubes in another order gets the same key, order[k] is the
+    # index in init of the k-th canonical tube
+    order = sorted(range(len(init)), key=lambda index: init[index])
+    key = (capacity, tuple(tuple(init[index]) for index in order))
+    return key, order
+
+
+def solve_board(init, capacity, options):
+    # runs in a worker process, the result only holds plain types so it pickles and serializes cheaply
+    options = dict(options, heuristic=heuristic_option(options.get("heuristic")))
+    result = solve(init_tubes(convert_init_list(init), capacity), **options)
+    return {"status": result.status, "moves": result.moves, "best_moves": result.best_moves,
+            "reason": result.reason, "stats": result.stats}
+
+
+def warm_up():
+    # imports the solver, loads the learned weights and runs a tiny solve so the first real request
+    # finds a warm worker
+    heuristic_option("learned")
+    solve_board([[], [0, 1], [1, 0]], 2, {})
+    return True
+
+
+def check_board(init, capacity):
+    # JSON hands over any type, the solver needs a positive integer capacity and lists of integer colors
+    if not isinstance(capacity, int) or isinstance(capacity, bool) or capacity <= 0:
+        raise ValueError(f"capacity must be a positive integer, got {capacity!r}")
+    if not isinstance(init, list):
+        raise ValueError(f"init must be a list of tubes, got {init!r}")
+    for index, tube in enumerate(init):
+        if not isinstance(tube, list):
+            raise ValueError(f"tube {index}: expected a list of colors, got {tube!r}")
+        for color in tube:
+            if not isinstance(color, int) or isinstance(color, bool):
+                raise ValueError(f"tube {index}: colors must be integers, got {color!r}")
+    init_tubes(convert_init_list(init), capacity)  # raises ValueError on an overfull tube
+
+
+def check_options(options, max_timeout):
+    # keeps the solve options of a request, raises ValueError on a value of the wrong type. A worker can not
+    # be stopped once it solves, so every solve gets a timeout of at most max_timeout, the default as well
+    checked = {"timeout": max_timeout}
+    for name, value in options.items():
+        if name not in SOLVE_OPTIONS or value is None:
+            continue
+        types = SOLVE_OPTIONS[name]
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            expected = " or ".join(kind.__name__ for kind in types)
+            raise ValueError(f"{name} must be {expected}, got {value!r}")
+        if name == "heuristic" and value not in HEURISTIC_NAMES:
+            raise ValueError(f"unknown heuristic {value!r}")
+        if name == "timeout":
+            if value <= 0:
+                raise ValueError(f"timeout must be positive, got {value!r}")
+            value = min(value, max_timeout)
+        checked[name] = value
+    return checked
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SolverService:
+    def __init__(self, workers=2, max_queue=64, max_timeout=30.0):
+        self.max_queue = max_queue
+        self.max_timeout = max_timeout
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        for future in [self.executor.submit(warm_up) for _ in range(workers)]:
+            future.result()
+
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.latencies = deque(maxlen=1000)
+        self.requests = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def submit(self, init, capacity, **options):
+        # returns a Future of the result with moves in the indexes of init, identical boards
+        # submitted while one is being solved share that solve
+        check_board(init, capacity)
+        options = check_options(options, self.max_timeout)
+        key, order = canonical_board(init, capacity)
+        key = (key, tuple(sorted(options.items())))
+        start = time.perf_counter()
+
+        with self.lock:
+            self.requests += 1
+            shared = self.in_flight.get(key)
+            started = shared is None
+            if started:
+                if len(self.in_flight) >= self.max_queue:
+                    self.rejected += 1
+                    raise ServiceBusy(f"{len(self.in_flight)} solves are already queued")
+                shared = self.executor.submit(solve_board, [init[index] for index in order], capacity, options)
+                self.in_flight[key] = shared
+            else:
+                self.coalesced += 1
+
+        # callbacks of a future that is already done run right away, so they are added without the lock
+        if started:
+            shared.add_done_callback(lambda _: self._finished(key))
+        future = Future()
+        shared.add_done_callback(lambda done: self._deliver(done, future, order, start))
+        return future
+
+    def _finished(self, key):
+        with self.lock:
+            self.in_flight.pop(key, None)
+
+    def _deliver(self, done, future, order, start):
+        error = done.exception()
+        if error is not None:
+            future.set_exception(error)
+            return
+        result = dict(done.result())
+        for name in ("moves", "best_moves"):
+            if result[name] is not None:
+                result[name] = [(order[source], order[destination]) for source, destination in result[name]]
+        with self.lock:
+            self.latencies.append(time.perf_counter() - start)
+        future.set_result(result)
+
+    def solve(self, init, capacity, **options):
+        return self.submit(init, capacity, **options).result()
+
+    def metrics(self):
+        with self.lock:
+            latencies = list(self.latencies)
+            return {"queue_depth": len(self.in_flight), "max_queue": self.max_queue, "requests": self.requests,
+                    "coalesced": self.coalesced, "rejected": self.rejected, "completed": len(latencies),
+                    "p50_latency": percentile(latencies, 0.5), "p99_latency": percentile(latencies, 0.99)}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    # POST /solve with {"init": [...], "capacity": n, ...solve options}, GET /metrics
+    service = None
+
+    def send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self.send_json(200, self.service.metrics())
+        else:
+            self.send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self.send_json(404, {"error": "not found"})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            init = request.pop("init")
+            capacity = request.pop("capacity")
+            future = self.service.submit(init, capacity, **request)
+        except ServiceBusy as error:
+            self.send_json(503, {"error": str(error)}, {"Retry-After": "1"})
+            return
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            self.send_json(400, {"error": f"bad request: {error}"})
+            return
+        try:
+            result = future.result()
+        except Exception as error:
+            self.send_json(500, {"error": f"solve failed: {error!r}"})
+            return
+        self.send_json(200, result)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(service, host="127.0.0.1", port=8080):
+    handler = type("BoundSolverHandler", (SolverHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class SolverClient:
+    # local stand-in client for the HTTP service
+    def __init__(self, url="http://127.0.0.1:8080", timeout=None):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def solve(self, init, capacity, **options):
+        body = json.dumps(dict(options, init=init, capacity=capacity)).encode()
+        request = urllib.request.Request(self.url + "/solve", data=body,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            if error.code == 503:
+                raise ServiceBusy(json.loads(error.read())["error"]) from None
+            raise
+
+    def metrics(self):
+        with urllib.request.urlopen(self.url + "/metrics", timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Long running solver service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--max-timeout", type=float, default=30.0,
+                        help="seconds a solve may run at most, also the timeout of requests that set none")
+    args = parser.parse_args(argv)
+
+    service = SolverService(workers=args.workers, max_queue=args.max_queue, max_timeout=args.max_timeout)
+    server = make_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
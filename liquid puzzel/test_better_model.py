@@ -1,5 +1,16 @@
+import asyncio
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
 from unittest import TestCase
-from better_model import Tube, init_tubes, is_solved, move, get_neighbors, heuristic_cost
+from unittest.mock import patch
+from board_generator import generate_board
+from better_model import Tube, init_tubes, is_solved, move, get_neighbors, heuristic_cost, convert_init_list, \
+    precheck_board, active_tubes, a_star_solve, is_deadlocked, state_fingerprint, DeadStateTable, order_moves, \
+    iter_successors, solve, solve_async, BucketQueue, start_tracing, stop_tracing, SOLVED, UNSOLVABLE, TIMEOUT, \
+    BUDGET_EXCEEDED, CANCELLED, EXHAUSTED
 
 
 class TestTube(TestCase):
@@ -163,6 +174,11 @@ class TestMove(TestCase):
         result = move(tubes, 4, 0)
         self.assertEqual(result, -1)
 
+    def test_move_between_identical_tubes(self):
+        tubes = [Tube([(1, 1)], 4), Tube([(1, 1)], 4)]
+        self.assertEqual(move(tubes, 0, 1), 0)
+        self.assertEqual(tubes[1].colors, [(1, 2)])
+
 
 class TestGetNeighbors(TestCase):
 
@@ -206,3 +222,342 @@ class Test_h(TestCase):
 
             self.assertEqual(actual_cost, expected_cost)
 
+
+
+class TestPrecheckBoard(TestCase):
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            init_tubes([[(1, 4)], []], 3)  # more colors than the capacity
+        with self.assertRaises(ValueError):
+            init_tubes([[(1, 0)], []], 3)  # empty group
+        with self.assertRaises(ValueError):
+            init_tubes([[1, 2], []], 3)  # not grouped by convert_init_list
+
+    def test_unsolvable(self):
+        tubes = init_tubes(convert_init_list([[], [0, 1, 1], [0, 0, 1]]), 3)
+        self.assertIsNone(precheck_board(tubes))
+
+        tubes = init_tubes(convert_init_list([[], [0, 1, 1], [0, 0]]), 3)
+        self.assertIn("not a multiple", precheck_board(tubes))
+
+        tubes = init_tubes(convert_init_list([[0, 1, 1], [1, 0, 0]]), 3)
+        self.assertIn("full", precheck_board(tubes))
+
+        with redirect_stdout(StringIO()):
+            self.assertEqual(a_star_solve(tubes), [])
+
+    def test_finished_tubes_are_cut_out(self):
+        init = [[], [0, 1, 1], [2, 0, 1], [0, 2, 2], [3, 3, 3]]
+        tubes = init_tubes(convert_init_list(init), 3)
+        self.assertEqual(active_tubes(tubes), [0, 1, 2, 3])
+
+        with redirect_stdout(StringIO()):
+            moves, iterations = a_star_solve(tubes)
+
+        for source, destination in moves:
+            self.assertNotEqual(source, 4)
+            self.assertNotEqual(destination, 4)
+            self.assertEqual(move(tubes, source, destination), 0)
+        self.assertTrue(is_solved(tubes))
+
+    def test_already_solved(self):
+        tubes = init_tubes(convert_init_list([[], [0, 0, 0], [1, 1, 1]]), 3)
+        self.assertEqual(a_star_solve(tubes), ([], 0))
+
+
+class TestDeadStates(TestCase):
+
+    def test_is_deadlocked(self):
+        self.assertTrue(is_deadlocked([Tube([(0, 1), (1, 1)], 3), Tube([(1, 1), (0, 1)], 3)]))
+        self.assertFalse(is_deadlocked([Tube([(0, 1), (1, 1)], 3), Tube([(0, 1), (1, 1)], 3), Tube([], 3)]))
+        self.assertFalse(is_deadlocked([Tube([(0, 1), (1, 1)], 3), Tube([(2, 1), (1, 1)], 3)]))
+        self.assertFalse(is_deadlocked([Tube([(0, 3)], 3), Tube([(1, 3)], 3)]))  # solved
+
+    def test_fingerprint_ignores_tube_order(self):
+        first = [Tube([(0, 1)], 3), Tube([(1, 2)], 3)]
+        second = [Tube([(1, 2)], 3), Tube([(0, 1)], 3)]
+        self.assertEqual(state_fingerprint(first), state_fingerprint(second))
+
+    def test_table_is_bounded(self):
+        table = DeadStateTable(max_size=2)
+        table.add("a")
+        table.add("b")
+        self.assertIn("a", table)  # "a" becomes the most recently used
+        table.add("c")
+        self.assertNotIn("b", table)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.evictions, 1)
+        self.assertEqual(table.hit_rate(), 0.5)
+
+    def test_get_neighbors_skips_dead_states(self):
+        tubes = [Tube([(0, 1), (1, 2)], 3), Tube([(1, 1), (0, 2)], 3), Tube([], 3)]
+        table = DeadStateTable()
+        neighbors = get_neighbors(tubes, 1, None, table)
+        for neighbor, _, _ in neighbors:
+            table.add(state_fingerprint(neighbor))
+        self.assertEqual(get_neighbors(tubes, 1, None, table), [])
+        self.assertEqual(table.hits, len(neighbors))
+
+    def test_table_is_opt_in(self):
+        tubes = init_tubes(convert_init_list([[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]), 3)
+        self.assertIsNone(solve(tubes).stats["dead_states"])
+        self.assertIn("hit_rate", solve(tubes, dead_states=DeadStateTable()).stats["dead_states"])
+
+    def test_solve_with_table(self):
+        tubes = init_tubes(convert_init_list([[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]), 3)
+        table = DeadStateTable()
+        with redirect_stdout(StringIO()):
+            moves, _ = a_star_solve(tubes, table)
+        for source, destination in moves:
+            self.assertEqual(move(tubes, source, destination), 0)
+        self.assertTrue(is_solved(tubes))
+
+
+class TestPartialExpansion(TestCase):
+
+    def setUp(self):
+        init = [[], [], [2, 3, 3, 2, 1], [1, 2, 4, 4, 2], [0, 0, 3, 3, 1], [1, 4, 2, 4, 0], [3, 4, 0, 1, 0]]
+        self.tubes = init_tubes(convert_init_list(init), 5)
+
+    def test_order_moves_matches_heuristic(self):
+        moves = order_moves(self.tubes, 2)
+        self.assertEqual(moves, sorted(moves))
+        successors = iter_successors(self.tubes, moves)
+        for (cost, _, i, j, _), (neighbor, move_action, neighbor_cost) in zip(moves, successors):
+            self.assertEqual(move_action, (i, j))
+            self.assertEqual(neighbor_cost, cost)
+            self.assertEqual(heuristic_cost(neighbor, 2), cost)
+
+    def test_other_heuristic_reuses_poured_tubes(self):
+        # the tubes built to score a move are the ones of its successor, and match the default ordering
+        moves = order_moves(self.tubes, 2, heuristic=lambda tubes, empty_tubes: heuristic_cost(tubes, empty_tubes))
+        self.assertEqual([move[:4] for move in moves], [move[:4] for move in order_moves(self.tubes, 2)])
+        for move_entry, (neighbor, _, _) in zip(moves, iter_successors(self.tubes, moves)):
+            _, _, i, j, (source, destination) = move_entry
+            self.assertIs(neighbor[i], source)
+            self.assertIs(neighbor[j], destination)
+            expected = [Tube(tube.colors[:], tube.capacity) for tube in self.tubes]
+            move(expected, i, j)
+            self.assertEqual([tube.colors for tube in neighbor], [tube.colors for tube in expected])
+
+    def test_successors_are_lazy_and_share_tubes(self):
+        moves = order_moves(self.tubes, 2)
+        successors = iter_successors(self.tubes, moves)
+        neighbor, (i, j), _ = next(successors)
+        for k, tube in enumerate(neighbor):
+            if k in (i, j):
+                self.assertIsNot(tube, self.tubes[k])
+            else:
+                self.assertIs(tube, self.tubes[k])
+
+    def test_solve(self):
+        with redirect_stdout(StringIO()):
+            moves, _ = a_star_solve(self.tubes, partial_expansion=True)
+        for source, destination in moves:
+            self.assertEqual(move(self.tubes, source, destination), 0)
+        self.assertTrue(is_solved(self.tubes))
+
+
+class TestPartialPour(TestCase):
+
+    def setUp(self):
+        # the top run of tube 0 is larger than the free space of tube 1
+        self.tubes = [Tube([(1, 1), (0, 2)], 3), Tube([(2, 1), (0, 1)], 3)]
+
+    def test_pop_count(self):
+        tube = Tube([(1, 1), (0, 3)], 4)
+        self.assertEqual(tube.pop(2), (0, 2))
+        self.assertEqual(tube.colors, [(1, 1), (0, 1)])
+        self.assertEqual(tube.size, 2)
+        self.assertEqual(tube.pop(5), (0, 1))
+        self.assertEqual(tube.pop(), (1, 1))
+        self.assertTrue(tube.is_empty())
+
+    def test_move(self):
+        self.assertEqual(move(self.tubes, 0, 1), -1)
+        self.assertTrue(is_deadlocked(self.tubes))
+        self.assertFalse(is_deadlocked(self.tubes, partial=True))
+        self.assertEqual(move(self.tubes, 0, 1, partial=True), 0)
+        self.assertEqual(self.tubes[0].colors, [(1, 1), (0, 1)])
+        self.assertEqual(self.tubes[1].colors, [(2, 1), (0, 2)])
+        self.assertEqual([tube.size for tube in self.tubes], [2, 3])
+
+    def test_order_moves_matches_heuristic(self):
+        tubes = init_tubes(convert_init_list([[0, 0, 1], [0, 2], [1, 1, 2], [2]]), 3)
+        moves = order_moves(tubes, 0, partial=True)
+        self.assertEqual([(i, j) for _, _, i, j, _ in moves], [(0, 1)])
+        self.assertEqual(order_moves(tubes, 0), [])
+        successors = iter_successors(tubes, moves, partial=True)
+        for (cost, _, i, j, _), (neighbor, move_action, neighbor_cost) in zip(moves, successors):
+            self.assertEqual(heuristic_cost(neighbor, 0), cost)
+
+    def test_solve(self):
+        init = [[], [], [2, 3, 3, 2, 1], [1, 2, 4, 4, 2], [0, 0, 3, 3, 1], [1, 4, 2, 4, 0], [3, 4, 0, 1, 0]]
+        for partial_expansion in (False, True):
+            tubes = init_tubes(convert_init_list(init), 5)
+            result = solve(tubes, partial=True, partial_expansion=partial_expansion)
+            self.assertTrue(result.solved)
+            for source, destination in result.moves:
+                self.assertEqual(move(tubes, source, destination, partial=True), 0)
+            self.assertTrue(is_solved(tubes))
+
+
+class TestBucketQueue(TestCase):
+
+    def setUp(self):
+        self.queue = BucketQueue()
+        for item, (h, g) in enumerate([(3, 1), (1, 2), (1, 1), (2, 0), (1, 1), (5, 0)]):
+            self.queue.push(item, h, g)
+
+    def pop_all(self):
+        items = []
+        while self.queue:
+            items.append(self.queue.pop())
+        return items
+
+    def test_order(self):
+        self.assertEqual(len(self.queue), 6)
+        self.assertEqual(self.pop_all(), [(2, (1, 1)), (4, (1, 1)), (1, (1, 2)), (3, (2, 0)), (0, (3, 1)),
+                                          (5, (5, 0))])
+        with self.assertRaises(IndexError):
+            self.queue.pop()
+
+    def test_decrease_key(self):
+        self.assertFalse(self.queue.push(0, 3, 2))
+        self.assertTrue(self.queue.push(0, 1, 0))
+        self.assertTrue(self.queue.push(5, 2, 0))
+        self.assertEqual(len(self.queue), 6)
+        self.assertEqual([item for item, _ in self.pop_all()], [0, 2, 4, 1, 3, 5])
+        # a popped id can be pushed again
+        self.queue.push(0, 4, 4)
+        self.assertEqual(self.queue.pop(), (0, (4, 4)))
+
+    def test_prune_above(self):
+        self.assertEqual(sorted(self.queue.prune_above(2)), [0, 5])
+        self.assertNotIn(5, self.queue)
+        self.assertEqual([item for item, _ in self.pop_all()], [2, 4, 1, 3])
+
+    def test_truncate(self):
+        self.queue.push(3, 1, 1)  # decrease-key leaves a stale entry behind
+        self.assertEqual(sorted(self.queue.truncate(2)), [0, 1, 3, 5])
+        self.assertEqual(self.pop_all(), [(2, (1, 1)), (4, (1, 1))])
+
+    def test_order_within_bucket(self):
+        queue = BucketQueue()
+        for item, sizes in enumerate([(2, 1), (1, 3), (2, 0), (1, 3)]):
+            queue.push(item, 0, 0, sizes)
+        self.assertEqual(queue.truncate(3), [0])
+        self.assertEqual([queue.pop()[0] for _ in range(3)], [1, 3, 2])
+
+
+class TestSolveBudget(TestCase):
+
+    def setUp(self):
+        self.easy = [[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]
+        # twenty colors dealt at random, far too large to solve within the tests
+        self.hard = generate_board(22, 4, 20, 2, seed=0)
+
+    def tubes(self, init, capacity):
+        return init_tubes(convert_init_list(init), capacity)
+
+    def test_solved(self):
+        tubes = self.tubes(self.easy, 3)
+        result = solve(tubes, timeout=10, max_expansions=1000)
+        self.assertEqual(result.status, SOLVED)
+        self.assertTrue(result.solved)
+        for source, destination in result.moves:
+            self.assertEqual(move(tubes, source, destination), 0)
+        self.assertTrue(is_solved(tubes))
+        self.assertTrue(is_solved(result.best_state))
+
+    def test_unsolvable(self):
+        result = solve(self.tubes([[0, 1, 1], [1, 0, 0]], 3))
+        self.assertEqual(result.status, UNSOLVABLE)
+        self.assertIsNotNone(result.reason)
+
+    def test_exhausted(self):
+        # passes the precheck but has no solution, once the frontier was cut the search cannot tell
+        tubes = self.tubes(generate_board(6, 4, 5, 1, seed=1), 4)
+        result = solve(tubes)
+        self.assertEqual(result.status, UNSOLVABLE)
+        self.assertIsNone(result.reason)
+        self.assertEqual(result.stats["dropped"], 0)
+        with patch("better_model.FRONTIER_LIMIT", 4), patch("better_model.FRONTIER_KEEP", 1):
+            result = solve(tubes)
+        self.assertEqual(result.status, EXHAUSTED)
+        self.assertGreater(result.stats["dropped"], 0)
+
+    def test_max_expansions(self):
+        tubes = self.tubes(self.hard, 4)
+        result = solve(tubes, max_expansions=50)
+        self.assertEqual(result.status, BUDGET_EXCEEDED)
+        self.assertEqual(result.stats["expansions"], 50)
+        self.assertIsNone(result.moves)
+        self.assertEqual(len(result.best_state), len(tubes))
+        for source, destination in result.best_moves:
+            self.assertEqual(move(tubes, source, destination), 0)
+        self.assertEqual([tube.colors for tube in tubes], [tube.colors for tube in result.best_state])
+
+    def test_timeout(self):
+        result = solve(self.tubes(self.hard, 4), timeout=0.05)
+        self.assertEqual(result.status, TIMEOUT)
+        self.assertLess(result.stats["elapsed"], 1)
+
+    def test_max_memory(self):
+        result = solve(self.tubes(self.hard, 4), max_memory=200 * 1024)
+        self.assertEqual(result.status, BUDGET_EXCEEDED)
+        self.assertIn("peak_memory", result.stats)
+        self.assertGreater(result.stats["peak_memory"], 200 * 1024)
+
+    def test_max_memory_of_concurrent_solves(self):
+        # the budget of a solve only counts its own states, whatever else runs next to it
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        async def run():
+            unbudgeted = solve_async(self.tubes(self.hard, 4), executor=executor, timeout=1)
+            budgeted = solve_async(self.tubes(self.hard, 4), executor=executor, timeout=5, max_memory=1024 * 1024)
+            return await asyncio.gather(unbudgeted, budgeted)
+
+        unbudgeted, budgeted = asyncio.run(run())
+        executor.shutdown(wait=True)
+        self.assertEqual(unbudgeted.status, TIMEOUT)
+        self.assertEqual(budgeted.status, BUDGET_EXCEEDED)
+        # the last expansion may overshoot the budget, but not by what the other solve holds
+        self.assertGreater(budgeted.stats["peak_memory"], 1024 * 1024)
+        self.assertLess(budgeted.stats["peak_memory"], 2 * 1024 * 1024)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_tracing_is_reference_counted(self):
+        start_tracing()
+        start_tracing()
+        stop_tracing()
+        self.assertTrue(tracemalloc.is_tracing())
+        stop_tracing()
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_cancel_event(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        self.assertEqual(solve(self.tubes(self.hard, 4), cancel_event=cancel_event).status, CANCELLED)
+
+    def test_solve_async(self):
+        async def run():
+            return await asyncio.gather(*(solve_async(self.tubes(self.easy, 3), timeout=10) for _ in range(4)))
+
+        for result in asyncio.run(run()):
+            self.assertEqual(result.status, SOLVED)
+
+    def test_solve_async_cancel(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        async def run():
+            task = asyncio.ensure_future(solve_async(self.tubes(self.hard, 4), executor=executor))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # the worker thread sees the cancellation and stops, so shutting down does not hang
+        executor.shutdown(wait=True)
@@ -0,0 +1,74 @@
+import os
+import tempfile
+from unittest import TestCase
+from better_model import DEFAULT_BOARD, convert_init_list, init_tubes
+from board_format import Board, encode_board, save_board, load_board, encode_solution, decode_solution, \
+    save_solution, load_solution, parse_rtf, convert_rtf
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "liquid puzzle test examples.rtf")
+
+
+class TestBoardFormat(TestCase):
+    def setUp(self):
+        self.init = [[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]
+
+    def test_round_trip(self):
+        board = Board(encode_board(self.init, 3))
+        self.assertEqual(board.num_tubes, 4)
+        self.assertEqual(board.capacity, 3)
+        self.assertEqual(board.colors.itemsize, 1)
+        self.assertEqual(board.tube(1), [1, 1, 0])  # bottom first
+        self.assertEqual(board.to_init(), self.init)
+        expected = init_tubes(convert_init_list(self.init), 3)
+        self.assertEqual([tube.colors for tube in board.to_tubes()], [tube.colors for tube in expected])
+
+    def test_wide_colors(self):
+        init = [[300, 2], [2, 300], []]
+        board = Board(encode_board(init, 2))
+        self.assertEqual(board.colors.itemsize, 2)
+        self.assertEqual(board.to_init(), init)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            encode_board([[0, 0, 0, 0]], 3)
+        with self.assertRaises(ValueError):
+            encode_board([[70000]], 3)
+        with self.assertRaises(ValueError):
+            Board(b"LQPS" + bytes(8))
+        with self.assertRaises(ValueError):
+            Board(encode_board(self.init, 3)[:-1])
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            board_path = os.path.join(directory, "board.lqb")
+            save_board(board_path, self.init, 3)
+            self.assertEqual(load_board(board_path).to_init(), self.init)
+
+            solution_path = os.path.join(directory, "board.lqs")
+            save_solution(solution_path, [(1, 0), (3, 1), (300, 2)])
+            self.assertEqual(load_solution(solution_path), [(1, 0), (3, 1), (300, 2)])
+
+    def test_solution_round_trip(self):
+        self.assertEqual(decode_solution(encode_solution([])), [])
+        with self.assertRaises(ValueError):
+            decode_solution(encode_board(self.init, 3))
+
+
+class TestRtfConversion(TestCase):
+    def test_parse_rtf(self):
+        with open(EXAMPLES) as file:
+            boards = parse_rtf(file.read())
+        self.assertEqual([number for number, _, _ in boards], list(range(20)))
+        number, init, capacity = boards[0]
+        self.assertEqual((init, capacity), ([[], [0, 1, 1], [2, 0, 1], [0, 2, 2]], 3))
+        # board 8 spans several lines in the RTF file
+        self.assertEqual(len(boards[8][1]), 10)
+        self.assertEqual(boards[8][1][2], [2, 1, 1, 4, 5, 6, 0, 2])
+
+    def test_shipped_boards_match_rtf(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for path in convert_rtf(EXAMPLES, directory):
+                shipped = os.path.join(os.path.dirname(DEFAULT_BOARD), os.path.basename(path))
+                with open(path, "rb") as converted, open(shipped, "rb") as expected:
+                    self.assertEqual(converted.read(), expected.read())
+        self.assertEqual(load_board(DEFAULT_BOARD).capacity, 100)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+from board_generator import solved_board, generate_board
+from better_model import convert_init_list, init_tubes, precheck_board, a_star_solve, move, is_solved
+
+
+class TestSolvedBoard(TestCase):
+    def test_solved_board(self):
+        board = solved_board(8, 4, 3, 2)
+        self.assertEqual(len(board), 8)
+        self.assertEqual(board[:2], [[0, 0, 0, 0], [0, 0, 0, 0]])
+        self.assertEqual(board[-2:], [[], []])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            solved_board(7, 4, 3, 2)  # 5 filled tubes for 3 colors
+        with self.assertRaises(ValueError):
+            solved_board(2, 4, 3, 2)  # no filled tube
+
+
+class TestGenerateBoard(TestCase):
+    def test_reproducible(self):
+        self.assertEqual(generate_board(7, 4, 5, 2, seed=3), generate_board(7, 4, 5, 2, seed=3))
+        self.assertEqual(generate_board(7, 4, 5, 2, shuffle_depth=30, seed=3),
+                         generate_board(7, 4, 5, 2, shuffle_depth=30, seed=3))
+        self.assertNotEqual(generate_board(7, 4, 5, 2, seed=3), generate_board(7, 4, 5, 2, seed=4))
+
+    def test_random_deal_is_valid(self):
+        init = generate_board(7, 4, 5, 2, seed=1)
+        self.assertEqual(init[-2:], [[], []])
+        units = sorted(color for tube in init for color in tube)
+        self.assertEqual(units, sorted(list(range(5)) * 4))
+        self.assertIsNone(precheck_board(init_tubes(convert_init_list(init), 4)))
+
+    def test_shuffled_board_is_solvable(self):
+        for seed in range(5):
+            init = generate_board(6, 4, 4, 2, shuffle_depth=15, seed=seed)
+            tubes = init_tubes(convert_init_list(init), 4)
+            moves, _ = a_star_solve(tubes, verbose=False)
+            for source, destination in moves:
+                self.assertEqual(move(tubes, source, destination), 0)
+            self.assertTrue(is_solved(tubes))
@@ -0,0 +1,68 @@
+from unittest import TestCase
+from better_model import Tube, DeadStateTable, convert_init_list, init_tubes, solve, move, is_solved
+from board_generator import generate_board
+from incremental import match_tubes, replay, resolve
+
+
+def board(init, capacity=4):
+    return init_tubes(convert_init_list(init), capacity)
+
+
+class TestIncremental(TestCase):
+    def setUp(self):
+        self.init = generate_board(8, 4, 6, 2, seed=0)
+        self.previous = board(self.init)
+        self.previous_moves = solve(self.previous).moves
+
+    def assert_solves(self, tubes, moves):
+        tubes = [Tube(tube.colors[:], tube.capacity) for tube in tubes]
+        for source, destination in moves:
+            self.assertEqual(move(tubes, source, destination), 0)
+        self.assertTrue(is_solved(tubes))
+
+    def test_match_tubes(self):
+        # reordered, one tube edited and one tube added
+        init = [[0, 1], [1, 1, 0], [], [0, 0, 1]]
+        new = [[0, 0, 1], [], [1, 0], [0, 1], [1, 1, 0, 0]]
+        self.assertEqual(match_tubes(board(init), board(new)), [3, 2, 1, 0])
+        self.assertEqual(match_tubes(board(new), board(init)), [3, 2, 1, 0, None])
+
+    def test_replay_stops_at_illegal_move(self):
+        mapping = list(range(len(self.previous)))
+        states = replay(self.previous, self.previous_moves, mapping)
+        self.assertEqual(len(states), len(self.previous_moves))
+        self.assertEqual(states[-1][1], self.previous_moves)
+        self.assertTrue(is_solved(states[-1][0]))
+        self.assertEqual(replay(self.previous, [(6, 7)] + self.previous_moves, mapping), [])
+
+    def test_added_tube(self):
+        tubes = board([[]] + self.init)
+        result = resolve(tubes, self.previous, self.previous_moves)
+        self.assertTrue(result.solved)
+        self.assert_solves(tubes, result.moves)
+        self.assertEqual(result.stats["expansions"], 0)
+        self.assertEqual(result.stats["reuse"]["replayed_moves"], len(self.previous_moves))
+        self.assertEqual(result.stats["reuse"]["matched_tubes"], len(self.previous))
+
+    def test_swapped_units(self):
+        init = [tube[:] for tube in self.init]
+        init[3][0], init[5][0] = init[5][0], init[3][0]
+        tubes = board(init)
+        dead_states = DeadStateTable()
+        solve(self.previous, dead_states=dead_states)
+        known_dead = len(dead_states)
+        result = resolve(tubes, self.previous, self.previous_moves, dead_states=dead_states)
+        self.assertTrue(result.solved)
+        self.assert_solves(tubes, result.moves)
+        reuse = result.stats["reuse"]
+        self.assertLess(reuse["replayed_moves"], len(self.previous_moves))
+        # the search met the previous solution again and took the rest of it
+        self.assertGreater(reuse["shortcut_moves"], 0)
+        self.assertEqual(result.moves[-reuse["shortcut_moves"]:], self.previous_moves[-reuse["shortcut_moves"]:])
+        self.assertEqual(reuse["known_dead_states"], known_dead)
+
+    def test_unrelated_board(self):
+        tubes = board(generate_board(8, 4, 6, 2, seed=1))
+        result = resolve(tubes, self.previous, self.previous_moves)
+        self.assertTrue(result.solved)
+        self.assert_solves(tubes, result.moves)
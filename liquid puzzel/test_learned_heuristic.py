@@ -0,0 +1,75 @@
+import os
+import tempfile
+from unittest import TestCase
+from better_model import Tube, convert_init_list, init_tubes, solve, move, is_solved
+from learned_heuristic import FEATURES, LearnedHeuristic, state_features, load_heuristic, heuristic_option
+from train_heuristic import fit_linear, solution_samples
+
+
+class TestStateFeatures(TestCase):
+    def test_state_features(self):
+        tubes = [Tube([(0, 2), (1, 1)], 4), Tube([(1, 1), (0, 2)], 4), Tube([(2, 4)], 4), Tube([], 4)]
+        features = dict(zip(FEATURES, state_features(tubes, 2)))
+        self.assertEqual(features["bias"], 1)
+        self.assertEqual(features["extra_groups"], 2)
+        self.assertEqual(features["extra_colors"], 2)
+        self.assertEqual(features["partial_tubes"], 2)
+        self.assertEqual(features["bottom_color_moves"], 0)
+        self.assertEqual(features["empty_deficit"], 1)
+        self.assertEqual(features["unfinished_tubes"], 2)
+
+    def test_features_do_not_depend_on_capacity(self):
+        # the same board with every unit doubled
+        tubes = [Tube([(0, 2), (1, 1)], 4), Tube([(1, 1), (0, 2)], 4), Tube([(2, 4)], 4), Tube([], 4)]
+        doubled = [Tube([(color, 2 * count) for color, count in tube.colors], 8) for tube in tubes]
+        self.assertEqual(state_features(doubled, 2), state_features(tubes, 2))
+
+
+class TestLearnedHeuristic(TestCase):
+    def test_fit_linear(self):
+        weights = [2.0, 1.0, 0.0, 0.5, 3.0, 0.0, 1.0]
+        samples = []
+        for a in range(4):
+            for b in range(3):
+                for c in range(3):
+                    row = [1, a, (a * b) % 5, b, c, (a + c) % 2, a * c]
+                    samples.append((row, sum(w * x for w, x in zip(weights, row))))
+        for fitted, expected in zip(fit_linear(samples, ridge=0.0), weights):
+            self.assertAlmostEqual(fitted, expected, places=6)
+
+    def test_batch_matches_call(self):
+        model = load_heuristic()
+        tubes = init_tubes(convert_init_list([[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]), 3)
+        other = init_tubes(convert_init_list([[], [1, 1, 1], [0, 0, 0], [2, 2, 2]]), 3)
+        self.assertEqual(model.batch([tubes, other], 1), [model(tubes, 1), model(other, 1)])
+        self.assertGreater(model(tubes, 1), model(other, 1))
+
+    def test_save_and_load(self):
+        model = LearnedHeuristic([0.5, 1, 0, 0, 1, 0, 0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.json")
+            model.save(path, samples=3)
+            self.assertEqual(LearnedHeuristic.load(path).weights, model.weights)
+
+    def test_heuristic_option(self):
+        self.assertIsNone(heuristic_option(None))
+        self.assertIsInstance(heuristic_option("learned"), LearnedHeuristic)
+        self.assertIs(heuristic_option("learned"), heuristic_option("learned"))  # loaded once
+        with self.assertRaises(ValueError):
+            heuristic_option("unknown")
+
+    def test_solution_samples(self):
+        init = [[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]
+        result = solve(init_tubes(convert_init_list(init), 3))
+        samples = solution_samples(init_tubes(convert_init_list(init), 3), result.moves)
+        self.assertEqual([target for _, target in samples], list(range(len(result.moves), -1, -1)))
+
+    def test_solve_with_learned_heuristic(self):
+        init = [[], [], [2, 3, 3, 2, 1], [1, 2, 4, 4, 2], [0, 0, 3, 3, 1], [1, 4, 2, 4, 0], [3, 4, 0, 1, 0]]
+        for partial_expansion in (False, True):
+            tubes = init_tubes(convert_init_list(init), 5)
+            result = solve(tubes, heuristic=load_heuristic(), partial_expansion=partial_expansion, timeout=30)
+            self.assertTrue(result.solved)
+            for source, destination in result.moves:
+                self.assertEqual(move(tubes, source, destination), 0)
+            self.assertTrue(is_solved(tubes))
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import tracemalloc
+from unittest import TestCase
+from better_model import convert_init_list, init_tubes, solve
+from search_profiler import PHASE_STACKS, PARENTS, SearchProfiler
+
+
+class TestSearchProfiler(TestCase):
+    def setUp(self):
+        init = [[], [], [2, 3, 3, 2, 1], [1, 2, 4, 4, 2], [0, 0, 3, 3, 1], [1, 4, 2, 4, 0], [3, 4, 0, 1, 0]]
+        self.tubes = init_tubes(convert_init_list(init), 5)
+
+    def test_phase_counters(self):
+        profiler = SearchProfiler()
+        result = solve(self.tubes, profiler=profiler)
+        self.assertEqual(result.moves, solve(self.tubes).moves)
+        self.assertEqual(profiler.calls["solve"], 1)
+        self.assertEqual(profiler.calls["expand"], result.stats["expansions"])
+        self.assertEqual(profiler.calls["is_solved"], result.stats["expansions"] + 1)
+        self.assertEqual(profiler.calls["copy"], profiler.calls["move"])
+        self.assertEqual(profiler.calls["order_moves"], 0)
+
+        own = profiler.self_times()
+        self.assertEqual(sum(own.values()), profiler.times["solve"])
+        for phase, parent in PARENTS.items():
+            self.assertLessEqual(profiler.times[phase], profiler.times[parent])
+
+    def test_partial_expansion(self):
+        profiler = SearchProfiler()
+        result = solve(self.tubes, partial_expansion=True, profiler=profiler)
+        self.assertTrue(result.solved)
+        self.assertGreater(profiler.calls["order_moves"], 0)
+        self.assertEqual(profiler.calls["heuristic"], 0)
+
+    def test_collapsed_stacks(self):
+        profiler = SearchProfiler()
+        solve(self.tubes, profiler=profiler)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solve.folded")
+            profiler.write_collapsed(path)
+            with open(path) as file:
+                lines = file.read().splitlines()
+        stacks = {}
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            stacks[stack] = int(weight)
+        self.assertIn(PHASE_STACKS["copy"], stacks)
+        self.assertNotIn(PHASE_STACKS["order_moves"], stacks)
+        self.assertTrue(all(weight >= 0 for weight in stacks.values()))
+
+    def test_allocations(self):
+        profiler = SearchProfiler(trace_allocations=True, sample_every=4)
+        solve(self.tubes, profiler=profiler)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(profiler.sampled["copy"], 0)
+        self.assertGreater(profiler.estimated_allocations()["copy"], 0)
+        self.assertIn("net KB", profiler.summary())
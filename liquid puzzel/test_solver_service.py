@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import Future
+from urllib.error import HTTPError
+from unittest import TestCase
+from unittest.mock import patch
+from board_generator import generate_board
+from better_model import convert_init_list, init_tubes, move, is_solved
+from solver_service import SolverService, SolverClient, ServiceBusy, canonical_board, check_options, make_server
+
+
+def apply_moves(init, capacity, moves):
+    tubes = init_tubes(convert_init_list(init), capacity)
+    for source, destination in moves:
+        if move(tubes, source, destination) != 0:
+            return False
+    return is_solved(tubes)
+
+
+class TestCanonicalBoard(TestCase):
+    def test_tube_order_does_not_matter(self):
+        key, order = canonical_board([[1, 0], [], [0, 1]], 2)
+        other_key, other_order = canonical_board([[0, 1], [1, 0], []], 2)
+        self.assertEqual(key, other_key)
+        self.assertEqual(order, [1, 2, 0])
+        self.assertEqual(other_order, [2, 0, 1])
+
+
+class TestCheckOptions(TestCase):
+    def test_timeout_is_bounded(self):
+        self.assertEqual(check_options({}, 10), {"timeout": 10})
+        self.assertEqual(check_options({"timeout": None, "unknown": 1}, 10), {"timeout": 10})
+        self.assertEqual(check_options({"timeout": 60, "partial": True}, 10), {"timeout": 10, "partial": True})
+        self.assertEqual(check_options({"timeout": 0.5}, 10), {"timeout": 0.5})
+        with self.assertRaises(ValueError):
+            check_options({"timeout": 0}, 10)
+
+
+class TestSolverService(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = SolverService(workers=1, max_queue=2)
+        cls.server = make_server(cls.service, port=0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.client = SolverClient(f"http://127.0.0.1:{cls.server.server_address[1]}")
+        cls.easy = [[], [0, 1, 1], [2, 0, 1], [0, 2, 2]]
+        cls.hard = generate_board(22, 4, 20, 2, seed=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.shutdown()
+
+    def test_solve_over_http(self):
+        result = self.client.solve(self.easy, 3)
+        self.assertEqual(result["status"], "solved")
+        self.assertTrue(apply_moves(self.easy, 3, result["moves"]))
+
+    def test_bad_request(self):
+        with self.assertRaises(HTTPError) as context:
+            self.client.solve([[0, 0, 0, 0]], 3)
+        self.assertEqual(context.exception.code, 400)
+
+    def test_bad_options(self):
+        for init, capacity, options in ((self.easy, 3, {"timeout": "abc"}), (self.easy, 3, {"partial": 1}),
+                                        (self.easy, 3, {"max_expansions": 1.5}), (self.easy, 3, {"heuristic": "x"}),
+                                        ("abc", 3, {}), ([[0, "a"]], 3, {}), (self.easy, "3", {})):
+            with self.assertRaises(HTTPError) as context:
+                self.client.solve(init, capacity, **options)
+            self.assertEqual(context.exception.code, 400)
+
+    def test_failed_solve(self):
+        future = Future()
+        future.set_exception(RuntimeError("worker died"))
+        with patch.object(self.service, "submit", return_value=future):
+            with self.assertRaises(HTTPError) as context:
+                self.client.solve(self.easy, 3)
+        self.assertEqual(context.exception.code, 500)
+        self.assertIn("worker died", context.exception.read().decode())
+
+    def test_coalescing(self):
+        permuted = self.hard[1:] + [self.hard[0]]
+        first = self.service.submit(self.hard, 4, timeout=0.5)
+        second = self.service.submit(permuted, 4, timeout=0.5)
+        self.assertEqual(self.service.metrics()["queue_depth"], 1)
+        self.assertGreaterEqual(self.service.metrics()["coalesced"], 1)
+
+        first, second = first.result(), second.result()
+        self.assertEqual(first["status"], "timeout")
+        # the shared result is mapped back to the tube order of each request
+        self.assertEqual(second["best_moves"],
+                         [((source - 1) % 22, (destination - 1) % 22) for source, destination in first["best_moves"]])
+
+    def test_backpressure(self):
+        futures = [self.service.submit(generate_board(22, 4, 20, 2, seed=seed), 4, timeout=0.3) for seed in (1, 2)]
+        with self.assertRaises(ServiceBusy):
+            self.service.submit(generate_board(22, 4, 20, 2, seed=3), 4, timeout=0.3)
+        for future in futures:
+            future.result()
+        self.assertGreaterEqual(self.service.metrics()["rejected"], 1)
+
+    def test_metrics(self):
+        self.client.solve(self.easy, 3)
+        metrics = self.client.metrics()
+        self.assertGreaterEqual(metrics["completed"], 1)
+        self.assertIsNotNone(metrics["p50_latency"])
+        self.assertLessEqual(metrics["p50_latency"], metrics["p99_latency"])
@@ -0,0 +1,114 @@
+import argparse
+import sys
+
+from better_model import convert_init_list, init_tubes, count_empty_tubes, move, solve
+from board_generator import generate_board
+from learned_heuristic import DEFAULT_WEIGHTS, FEATURES, LearnedHeuristic, state_features
+
+
+def solution_samples(tubes, moves):
+    # one (features, moves left) sample for every state along a solution
+    empty_tubes = count_empty_tubes(tubes)
+    samples = [(state_features(tubes, empty_tubes), len(moves))]
+    for step, (source, destination) in enumerate(moves):
+        move(tubes, source, destination)
+        samples.append((state_features(tubes, empty_tubes), len(moves) - step - 1))
+    return samples
+
+
+def collect_samples(boards, capacity, timeout, **options):
+    # the samples of every solved board, one list per board
+    samples = []
+    for init in boards:
+        tubes = init_tubes(convert_init_list(init), capacity)
+        result = solve(tubes, timeout=timeout, **options)
+        if result.solved:
+            samples.append(solution_samples(tubes, result.moves))
+    return samples
+
+
+def fit_linear(samples, ridge=1.0):
+    # ridge regression from the normal equations, the bias is not penalized
+    size = len(FEATURES)
+    matrix = [[0.0] * size for _ in range(size)]
+    vector = [0.0] * size
+    for row, target in samples:
+        for i in range(size):
+            vector[i] += row[i] * target
+            for j in range(size):
+                matrix[i][j] += row[i] * row[j]
+    for i in range(1, size):
+        matrix[i][i] += ridge
+
+    # gaussian elimination with partial pivoting
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda index: abs(matrix[index][column]))
+        matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+        vector[column], vector[pivot] = vector[pivot], vector[column]
+        if matrix[column][column] == 0:
+            continue
+        for index in range(column + 1, size):
+            factor = matrix[index][column] / matrix[column][column]
+            for j in range(column, size):
+                matrix[index][j] -= factor * matrix[column][j]
+            vector[index] -= factor * vector[column]
+
+    weights = [0.0] * size
+    for column in reversed(range(size)):
+        if matrix[column][column] == 0:
+            continue
+        total = vector[column] - sum(matrix[column][j] * weights[j] for j in range(column + 1, size))
+        weights[column] = total / matrix[column][column]
+    return weights
+
+
+def mean_absolute_error(model, samples):
+    predictions = model.predict([row for row, _ in samples])
+    return sum(abs(prediction - target) for prediction, (_, target) in zip(predictions, samples)) / len(samples)
+
+
+def parse_ints(text):
+    return [int(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the learned heuristic on solved generated boards")
+    parser.add_argument("--colors", type=parse_ints, default=[3, 4, 5, 6, 8, 10, 12])
+    parser.add_argument("--capacity", type=parse_ints, default=[4, 8, 12],
+                        help="comma separated tube capacities, the weights are shared by all of them")
+    parser.add_argument("--empty", type=int, default=2)
+    parser.add_argument("--boards", type=int, default=40, help="boards per color count")
+    parser.add_argument("--shuffle-depth", type=int, default=None,
+                        help="scramble depth of the boards, colors are dealt at random when not given")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--ridge", type=float, default=1.0)
+    parser.add_argument("--output", default=DEFAULT_WEIGHTS)
+    args = parser.parse_args(argv)
+
+    samples = []
+    for capacity in args.capacity:
+        for num_colors in args.colors:
+            boards = [generate_board(num_colors + args.empty, capacity, num_colors, args.empty,
+                                     shuffle_depth=args.shuffle_depth, seed=seed) for seed in range(args.boards)]
+            board_samples = collect_samples(boards, capacity, args.timeout)
+            print(f"capacity {capacity}, {num_colors} colors: {len(board_samples)}/{len(boards)} boards solved, "
+                  f"{sum(map(len, board_samples))} samples")
+            samples.extend(board_samples)
+
+    # every fifth board is held out to report the error, the states of one solution are alike so they
+    # stay on the same side
+    train = [sample for index, board_samples in enumerate(samples) if index % 5 for sample in board_samples]
+    test = [sample for index, board_samples in enumerate(samples) if not index % 5 for sample in board_samples]
+    model = LearnedHeuristic(fit_linear(train, args.ridge))
+    error = mean_absolute_error(model, test)
+    print(f"held out mean absolute error: {error:.2f} moves")
+    for name, weight in zip(FEATURES, model.weights):
+        print(f"  {name:20s} {weight:8.3f}")
+
+    model.save(args.output, samples=len(train), held_out_error=round(error, 3), capacities=args.capacity,
+               colors=args.colors)
+    print(f"weights written to {args.output}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])